@@ -0,0 +1,60 @@
+"""
+Configuratie voor de Polymarket Data Logger.
+Pas hier de markten en API instellingen aan.
+"""
+
+# === MARKTEN ===
+MARKET_SLUGS = [
+    "fed-decision-in-january",
+    "who-will-trump-nominate-as-fed-chair",
+    "us-strikes-iran-by",
+]
+
+# === API'S ===
+GAMMA_API = "https://gamma-api.polymarket.com"
+CLOB_API = "https://clob.polymarket.com"
+
+REQUEST_TIMEOUT = 10  # seconden
+MAX_CONNECTIONS = 16
+MAX_CONNECTIONS_PER_HOST = 8
+
+# Maximaal aantal gelijktijdige requests per API (rate limits)
+GAMMA_CONCURRENCY = 4
+CLOB_CONCURRENCY = 8
+
+# Seconden tussen runs bij `fetch_data.py --daemon`
+DAEMON_INTERVAL = 60
+
+# Retries bij rate limits en tijdelijke server fouten
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# === BESTANDEN ===
+DATA_FILE = "data.csv"
+CACHE_FILE = "gamma_cache.json"
+CACHE_TTL = 24 * 60 * 60  # Token IDs en vragen veranderen zelden
+PARQUET_DIR = "data"  # Doelmap van export_parquet.py
+WRITE_BUFFER = 1 << 16
+
+FIELDNAMES = (
+    "timestamp",
+    "slug",
+    "question",
+    "price",
+    "best_bid",
+    "best_ask",
+    "spread",
+    "bid_depth",
+    "ask_depth",
+    "volume",
+    "liquidity",
+)
+
+# Afronding per kolom, pas toegepast bij het schrijven naar CSV
+CSV_DECIMALS = {
+    "price": 4,
+    "spread": 4,
+    "bid_depth": 2,
+    "ask_depth": 2,
+}
@@ -4,36 +4,181 @@ Polymarket Data Logger v2
 Haalt prijzen, spreads en volume op voor geselecteerde markten.
 """
 
-import requests
+import argparse
+import asyncio
 import csv
-import os
+import io
+import json
+import math
+import time
 from datetime import datetime, timezone
+from operator import itemgetter
+from types import MappingProxyType
 
-# === CONFIGURATIE ===
-MARKET_SLUGS = [
-    "fed-decision-in-january",
-    "who-will-trump-nominate-as-fed-chair",
-    "us-strikes-iran-by",
-]
+import aiohttp
+import orjson
 
-GAMMA_API = "https://gamma-api.polymarket.com"
-CLOB_API = "https://clob.polymarket.com"
-DATA_FILE = "data.csv"
+from config import (
+    BACKOFF_FACTOR,
+    CACHE_FILE,
+    CACHE_TTL,
+    CLOB_API,
+    CLOB_CONCURRENCY,
+    CSV_DECIMALS,
+    DAEMON_INTERVAL,
+    DATA_FILE,
+    FIELDNAMES,
+    GAMMA_API,
+    GAMMA_CONCURRENCY,
+    MARKET_SLUGS,
+    MAX_CONNECTIONS,
+    MAX_CONNECTIONS_PER_HOST,
+    MAX_RETRIES,
+    REQUEST_TIMEOUT,
+    RETRY_STATUSES,
+    WRITE_BUFFER,
+)
 
+EVENTS_URL = f"{GAMMA_API}/events"
+BOOK_URL = f"{CLOB_API}/book"
+BOOKS_URL = f"{CLOB_API}/books"
+MIDPOINT_URL = f"{CLOB_API}/midpoint"
 
-def get_markets_for_event(slug: str) -> list[dict]:
+TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+_row_values = itemgetter(*FIELDNAMES)
+_level_price = itemgetter("price")
+_level_size = itemgetter("size")
+_rounded_columns = [(FIELDNAMES.index(name), digits) for name, digits in CSV_DECIMALS.items()]
+
+# Lege orderbook waarden; alleen gekopieerd als er echt een resultaat nodig is
+_EMPTY_BOOK = MappingProxyType({
+    "best_bid": None,
+    "best_ask": None,
+    "spread": None,
+    "bid_depth": 0,
+    "ask_depth": 0,
+})
+
+# Events die in de huidige run al zijn opgehaald (slug → event)
+_event_cache: dict[str, dict | None] = {}
+
+# Semaphore per API, aangemaakt binnen de event loop van de run
+_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Eén gedeelde sessie: keep-alive verbindingen worden hergebruikt."""
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+    )
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=TIMEOUT)
+
+
+def api_semaphore(url: str) -> asyncio.Semaphore:
+    """Semaphore die het aantal gelijktijdige requests naar één API begrenst."""
+    if url.startswith(GAMMA_API):
+        api, limit = GAMMA_API, GAMMA_CONCURRENCY
+    else:
+        api, limit = CLOB_API, CLOB_CONCURRENCY
+    
+    if api not in _semaphores:
+        _semaphores[api] = asyncio.Semaphore(limit)
+    return _semaphores[api]
+
+
+async def get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: dict | list[tuple] | None = None,
+):
+    """GET request met retry/backoff; geeft geparste JSON of None terug."""
+    return await request_json(session, "GET", url, params=params)
+
+
+async def post_json(session: aiohttp.ClientSession, url: str, payload):
+    """POST request met JSON body, met dezelfde retry/backoff als get_json."""
+    return await request_json(session, "POST", url, json=payload)
+
+
+async def request_json(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    **kwargs,
+):
+    """Voer een request uit met retries op 429/5xx en connectiefouten."""
+    semaphore = api_semaphore(url)
+    
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            # Backoff gebeurt buiten de semaphore, zodat andere requests door kunnen
+            async with semaphore, session.request(method, url, **kwargs) as resp:
+                if resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return orjson.loads(await resp.read()) if resp.ok else None
+        except aiohttp.ClientConnectionError:
+            if attempt == MAX_RETRIES:
+                raise
+        
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+
+
+def parse_list(value) -> list:
+    """Gamma levert lijsten soms als JSON string, bijv. '["0.95","0.05"]'."""
+    if isinstance(value, str):
+        return orjson.loads(value) if value else []
+    return value or []
+
+
+async def get_event(session: aiohttp.ClientSession, slug: str) -> dict | None:
+    """Haal een Gamma event op.
+    
+    Binnen één run wordt elk event maar één keer opgehaald; de Gamma
+    fallback hergebruikt zo het event van get_markets_for_event.
+    """
+    if slug not in _event_cache:
+        events = await get_json(session, EVENTS_URL, {"slug": slug})
+        _event_cache[slug] = events[0] if events else None
+    return _event_cache[slug]
+
+
+async def prefetch_events(session: aiohttp.ClientSession, slugs: list[str]):
+    """Haal de events van meerdere slugs op in één Gamma request.
+    
+    Vult de event cache van deze run; slugs die niet in het antwoord
+    zitten worden daarna gewoon per slug opgehaald door get_event.
+    """
+    if len(slugs) < 2:
+        return
+    
+    try:
+        params = [("slug", slug) for slug in slugs]
+        events = await get_json(session, EVENTS_URL, params)
+        for event in events or []:
+            if event.get("slug") in slugs:
+                _event_cache[event["slug"]] = event
+    except Exception as e:
+        print(f"  Fout bij ophalen events: {e}")
+
+
+async def get_markets_for_event(session: aiohttp.ClientSession, slug: str) -> list[dict]:
     """Haal alle markets op voor een event slug."""
     markets = []
     
     try:
         # Haal event op met alle markets
-        resp = requests.get(f"{GAMMA_API}/events?slug={slug}", timeout=10)
-        if resp.ok and resp.json():
-            event = resp.json()[0]
+        event = await get_event(session, slug)
+        if event:
             
             for market in event.get("markets", []):
                 # Haal token IDs - dit zijn YES en NO tokens
-                clob_token_ids = market.get("clobTokenIds", [])
+                try:
+                    clob_token_ids = parse_list(market.get("clobTokenIds"))
+                    outcomes = parse_list(market.get("outcomes"))
+                except ValueError:
+                    clob_token_ids, outcomes = [], []
                 
                 if clob_token_ids and len(clob_token_ids) > 0:
                     # Eerste token is meestal YES
@@ -41,7 +186,7 @@ def get_markets_for_event(slug: str) -> list[dict]:
                         "slug": slug,
                         "question": market.get("question", ""),
                         "token_id": clob_token_ids[0],  # YES token
-                        "outcome": market.get("outcomes", ["Yes"])[0] if market.get("outcomes") else "Yes",
+                        "outcome": outcomes[0] if outcomes else "Yes",
                     })
             
             # Als geen markets met tokens, probeer event-level data
@@ -51,7 +196,7 @@ def get_markets_for_event(slug: str) -> list[dict]:
                 outcome_prices = market.get("outcomePrices", "")
                 if outcome_prices:
                     try:
-                        prices = eval(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
+                        prices = parse_list(outcome_prices)
                         if prices and len(prices) > 0:
                             markets.append({
                                 "slug": slug,
@@ -60,7 +205,7 @@ def get_markets_for_event(slug: str) -> list[dict]:
                                 "outcome": "Yes",
                                 "price_from_gamma": float(prices[0]) if prices[0] else None,
                             })
-                    except:
+                    except ValueError:
                         pass
                         
     except Exception as e:
@@ -69,52 +214,135 @@ def get_markets_for_event(slug: str) -> list[dict]:
     return markets
 
 
-def get_orderbook(token_id: str) -> dict:
-    """Haal orderbook data op via CLOB API."""
-    result = {
-        "best_bid": None,
-        "best_ask": None,
-        "spread": None,
-        "bid_depth": 0,
-        "ask_depth": 0,
-    }
+def load_json(path: str) -> dict:
+    """Lees een JSON cache bestand van disk (leeg als het ontbreekt of kapot is)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json(path: str, data: dict):
+    """Schrijf een JSON cache bestand naar disk."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def cached_markets(cache: dict, slug: str) -> list[dict] | None:
+    """Markets uit de cache, of None als de entry ontbreekt of verlopen is."""
+    entry = cache.get(slug)
+    # Handmatig aangepaste of halve entries tellen als verlopen
+    if entry and time.time() - entry.get("fetched_at", 0) < CACHE_TTL:
+        return entry.get("markets")
+    return None
+
+
+async def get_markets_cached(
+    session: aiohttp.ClientSession,
+    slug: str,
+    cache: dict,
+) -> list[dict]:
+    """Markets uit de cache, of opnieuw ophalen als de entry verlopen is."""
+    markets = cached_markets(cache, slug)
+    if markets is not None:
+        return markets
+    
+    markets = await get_markets_for_event(session, slug)
+    
+    # Alleen token IDs cachen; Gamma fallback prijzen zijn niet statisch
+    if markets and all(m.get("token_id") for m in markets):
+        cache[slug] = {"markets": markets, "fetched_at": time.time()}
+    
+    return markets
+
+
+def book_side(levels: list[dict], best) -> tuple[float, float]:
+    """Beste prijs en totaal volume van één kant van het orderbook.
+    
+    De volgorde van de levels maakt niet uit: `best` is max voor bids en
+    min voor asks. CLOB geeft altijd 'price' en 'size'. Beide waarden
+    worden gestreamd, zonder tussenlijsten.
+    """
+    best_price = best(map(float, map(_level_price, levels)))
+    return best_price, math.fsum(map(float, map(_level_size, levels)))
+
+
+def parse_orderbook(book: dict) -> dict:
+    """Haal beste prijzen, spread en depth uit een CLOB orderbook."""
+    result = dict(_EMPTY_BOOK)
+    bids = book.get("bids", [])
+    asks = book.get("asks", [])
+    
+    if bids:
+        result["best_bid"], result["bid_depth"] = book_side(bids, max)
+    
+    if asks:
+        result["best_ask"], result["ask_depth"] = book_side(asks, min)
     
+    if result["best_bid"] and result["best_ask"]:
+        result["spread"] = result["best_ask"] - result["best_bid"]
+    
+    return result
+
+
+async def get_orderbook(session: aiohttp.ClientSession, token_id: str) -> dict:
+    """Haal orderbook data op via CLOB API."""
     if not token_id:
-        return result
+        return dict(_EMPTY_BOOK)
     
     try:
-        resp = requests.get(f"{CLOB_API}/book?token_id={token_id}", timeout=10)
-        if resp.ok:
-            book = resp.json()
-            bids = book.get("bids", [])
-            asks = book.get("asks", [])
-            
-            if bids:
-                result["best_bid"] = float(bids[0].get("price", 0))
-                result["bid_depth"] = sum(float(b.get("size", 0)) for b in bids)
-            
-            if asks:
-                result["best_ask"] = float(asks[0].get("price", 0))
-                result["ask_depth"] = sum(float(a.get("size", 0)) for a in asks)
-            
-            if result["best_bid"] and result["best_ask"]:
-                result["spread"] = round(result["best_ask"] - result["best_bid"], 4)
+        book = await get_json(session, BOOK_URL, {"token_id": token_id})
+        if book:
+            return parse_orderbook(book)
     
     except Exception as e:
         print(f"  Fout bij ophalen orderbook: {e}")
     
-    return result
+    return dict(_EMPTY_BOOK)
+
+
+async def get_orderbooks(
+    session: aiohttp.ClientSession,
+    token_ids: list[str],
+) -> dict[str, dict]:
+    """Haal alle orderbooks op met één POST /books request.
+    
+    Books die ontbreken in het antwoord worden alsnog per token opgehaald.
+    """
+    orderbooks = {}
+    
+    if token_ids:
+        try:
+            books = await post_json(session, BOOKS_URL, [{"token_id": t} for t in token_ids])
+        except Exception as e:
+            print(f"  Fout bij ophalen orderbooks: {e}")
+            books = None
+        
+        # Per book parsen: één kapot book laat de rest van de batch intact
+        for book in books if isinstance(books, list) else []:
+            if isinstance(book, dict) and book.get("asset_id") in token_ids:
+                try:
+                    orderbooks[book["asset_id"]] = parse_orderbook(book)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"  Fout bij verwerken orderbook {book['asset_id']}: {e}")
+    
+    missing = [t for t in token_ids if t not in orderbooks]
+    fallback = await asyncio.gather(*(get_orderbook(session, t) for t in missing))
+    orderbooks.update(zip(missing, fallback))
+    
+    return orderbooks
 
 
-def get_midpoint(token_id: str) -> float | None:
+async def get_midpoint(session: aiohttp.ClientSession, token_id: str) -> float | None:
     """Haal midpoint prijs op."""
     if not token_id:
         return None
     
     try:
-        resp = requests.get(f"{CLOB_API}/midpoint?token_id={token_id}", timeout=10)
-        if resp.ok:
-            data = resp.json()
+        data = await get_json(session, MIDPOINT_URL, {"token_id": token_id})
+        if data:
             return float(data.get("mid", 0))
     except Exception as e:
         print(f"  Fout bij ophalen midpoint: {e}")
@@ -122,23 +350,19 @@ def get_midpoint(token_id: str) -> float | None:
     return None
 
 
-def get_price_from_gamma(slug: str) -> dict | None:
+async def get_price_from_gamma(session: aiohttp.ClientSession, slug: str) -> dict | None:
     """Fallback: haal prijs direct uit Gamma API."""
     try:
-        resp = requests.get(f"{GAMMA_API}/events?slug={slug}", timeout=10)
-        if resp.ok and resp.json():
-            event = resp.json()[0]
+        event = await get_event(session, slug)
+        if event:
             if event.get("markets"):
                 market = event["markets"][0]
                 outcome_prices = market.get("outcomePrices", "")
                 
                 # Parse outcome prices
                 if outcome_prices:
-                    if isinstance(outcome_prices, str):
-                        # Format: '["0.95","0.05"]' of '[0.95,0.05]'
-                        prices = eval(outcome_prices)
-                    else:
-                        prices = outcome_prices
+                    # Format: '["0.95","0.05"]' of '[0.95,0.05]'
+                    prices = parse_list(outcome_prices)
                     
                     if prices and len(prices) > 0:
                         return {
@@ -153,100 +377,181 @@ def get_price_from_gamma(slug: str) -> dict | None:
     return None
 
 
-def write_to_csv(rows: list[dict]):
-    """Schrijf data naar CSV bestand."""
-    file_exists = os.path.exists(DATA_FILE)
-    
-    fieldnames = [
-        "timestamp",
-        "slug", 
-        "question",
-        "price",
-        "best_bid",
-        "best_ask", 
-        "spread",
-        "bid_depth",
-        "ask_depth",
-        "volume",
-        "liquidity",
-    ]
-    
-    with open(DATA_FILE, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        
-        if not file_exists:
-            writer.writeheader()
-        
-        writer.writerows(rows)
+def rounded(value, digits: int = 4):
+    """Rond floats af voor output; None en strings blijven ongewijzigd."""
+    return round(value, digits) if isinstance(value, float) else value
 
 
-def main():
-    """Hoofdfunctie: haal data op voor alle markten."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-    rows = []
+def format_row(row: dict) -> list:
+    """Zet een rij om naar CSV waarden in kolomvolgorde, afgerond per kolom."""
+    values = list(_row_values(row))
+    for i, digits in _rounded_columns:
+        values[i] = rounded(values[i], digits)
+    return values
+
+
+def open_data_file() -> io.TextIOWrapper:
+    """Open het CSV bestand om toe te voegen, met één 64 KB schrijfbuffer."""
+    raw = io.FileIO(DATA_FILE, "a")
+    buf = io.BufferedWriter(raw, buffer_size=WRITE_BUFFER)
+    return io.TextIOWrapper(buf, encoding="utf-8", newline="")
+
+
+def write_to_csv(f: io.TextIOWrapper, rows: list[dict]):
+    """Schrijf een batch rijen naar het geopende CSV bestand en flush."""
+    writer = csv.writer(f)
     
-    print(f"[{timestamp}] Data ophalen voor {len(MARKET_SLUGS)} markten...")
+    # In append mode staat de positie aan het eind: 0 betekent een leeg bestand
+    if f.tell() == 0:
+        writer.writerow(FIELDNAMES)
     
-    for slug in MARKET_SLUGS:
-        print(f"  Processing: {slug}")
+    # Rijen als lijsten in vaste kolomvolgorde (format_row), zonder DictWriter lookups
+    writer.writerows(map(format_row, rows))
+    f.flush()
+
+
+async def fetch_row(
+    session: aiohttp.ClientSession,
+    slug: str,
+    markets: list[dict],
+    orderbooks: dict,
+    timestamp: str,
+) -> dict | None:
+    """Bouw de CSV rij voor één slug uit CLOB of (fallback) Gamma data."""
+    if markets and markets[0].get("token_id"):
+        # We hebben token IDs - gebruik CLOB API
+        market = markets[0]  # Pak eerste market/outcome
+        token_id = market["token_id"]
         
-        # Probeer eerst via CLOB (orderbook data)
-        markets = get_markets_for_event(slug)
+        orderbook = orderbooks[token_id]
         
-        if markets and markets[0].get("token_id"):
-            # We hebben token IDs - gebruik CLOB API
-            market = markets[0]  # Pak eerste market/outcome
-            token_id = market["token_id"]
-            
-            orderbook = get_orderbook(token_id)
-            midpoint = get_midpoint(token_id)
-            
-            row = {
-                "timestamp": timestamp,
-                "slug": slug,
-                "question": market.get("question", "")[:100],
-                "price": midpoint,
-                "best_bid": orderbook.get("best_bid"),
-                "best_ask": orderbook.get("best_ask"),
-                "spread": orderbook.get("spread"),
-                "bid_depth": round(orderbook.get("bid_depth", 0), 2),
-                "ask_depth": round(orderbook.get("ask_depth", 0), 2),
-                "volume": "",
-                "liquidity": "",
-            }
-            print(f"    ✓ CLOB: prijs={midpoint}, spread={orderbook.get('spread')}")
-            
+        # Midpoint volgt uit best bid (max) en best ask (min) van het orderbook;
+        # bij een eenzijdig of gekruist boek toch /midpoint vragen
+        best_bid, best_ask = orderbook["best_bid"], orderbook["best_ask"]
+        if best_bid is not None and best_ask is not None and best_bid <= best_ask:
+            midpoint = (best_bid + best_ask) / 2
         else:
-            # Fallback naar Gamma API (alleen prijs, geen orderbook)
-            gamma_data = get_price_from_gamma(slug)
-            
-            if gamma_data:
-                row = {
-                    "timestamp": timestamp,
-                    "slug": slug,
-                    "question": gamma_data.get("question", "")[:100],
-                    "price": gamma_data.get("price"),
-                    "best_bid": None,
-                    "best_ask": None,
-                    "spread": None,
-                    "bid_depth": 0,
-                    "ask_depth": 0,
-                    "volume": gamma_data.get("volume", ""),
-                    "liquidity": gamma_data.get("liquidity", ""),
-                }
-                print(f"    ✓ Gamma: prijs={gamma_data.get('price')}")
-            else:
-                print(f"    ⚠ Geen data gevonden")
-                continue
+            midpoint = await get_midpoint(session, token_id)
         
-        rows.append(row)
+        print(f"  {slug}: ✓ CLOB: prijs={rounded(midpoint)}, spread={rounded(orderbook['spread'])}")
+        return {
+            "timestamp": timestamp,
+            "slug": slug,
+            "question": market.get("question", "")[:100],
+            "price": midpoint,
+            "best_bid": orderbook.get("best_bid"),
+            "best_ask": orderbook.get("best_ask"),
+            "spread": orderbook.get("spread"),
+            "bid_depth": orderbook.get("bid_depth", 0),
+            "ask_depth": orderbook.get("ask_depth", 0),
+            "volume": "",
+            "liquidity": "",
+        }
+    
+    # Fallback naar Gamma API (alleen prijs, geen orderbook)
+    gamma_data = await get_price_from_gamma(session, slug)
+    
+    if gamma_data:
+        print(f"  {slug}: ✓ Gamma: prijs={gamma_data.get('price')}")
+        return {
+            "timestamp": timestamp,
+            "slug": slug,
+            "question": gamma_data.get("question", "")[:100],
+            "price": gamma_data.get("price"),
+            "best_bid": None,
+            "best_ask": None,
+            "spread": None,
+            "bid_depth": 0,
+            "ask_depth": 0,
+            "volume": gamma_data.get("volume", ""),
+            "liquidity": gamma_data.get("liquidity", ""),
+        }
+    
+    print(f"  {slug}: ⚠ Geen data gevonden")
+    return None
+
+
+async def run_once(session: aiohttp.ClientSession, f: io.TextIOWrapper, cache: dict):
+    """Eén run: haal data op voor alle markten (parallel) en schrijf de rijen."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    
+    print(f"[{timestamp}] Data ophalen voor {len(MARKET_SLUGS)} markten...")
+    
+    _event_cache.clear()
+    
+    # Eerst alle ontbrekende events in één request, daarna alle orderbooks in één keer
+    await prefetch_events(
+        session, [slug for slug in MARKET_SLUGS if cached_markets(cache, slug) is None]
+    )
+    all_markets = await asyncio.gather(
+        *(get_markets_cached(session, slug, cache) for slug in MARKET_SLUGS)
+    )
+    token_ids = list(dict.fromkeys(
+        markets[0]["token_id"] for markets in all_markets
+        if markets and markets[0].get("token_id")
+    ))
+    orderbooks = await get_orderbooks(session, token_ids)
+    results = await asyncio.gather(
+        *(fetch_row(session, slug, markets, orderbooks, timestamp)
+          for slug, markets in zip(MARKET_SLUGS, all_markets))
+    )
+    
+    save_json(CACHE_FILE, cache)
+    rows = [row for row in results if row]
     
     if rows:
-        write_to_csv(rows)
+        write_to_csv(f, rows)
         print(f"\n→ {len(rows)} rijen geschreven naar {DATA_FILE}")
     else:
         print("\n⚠ Geen data om te schrijven")
 
 
+async def main(daemon: bool = False, interval: float = DAEMON_INTERVAL):
+    """Hoofdfunctie: één run, of in daemon mode elke `interval` seconden."""
+    _semaphores.clear()
+    # Alleen geldige entries bewaren voor slugs die nog gevolgd worden
+    cache = {
+        slug: entry for slug, entry in load_json(CACHE_FILE).items()
+        if slug in MARKET_SLUGS and isinstance(entry, dict)
+    }
+    
+    async with create_session() as session:
+        with open_data_file() as f:
+            if not daemon:
+                await run_once(session, f, cache)
+                return
+            
+            # Sessie (keep-alive, TLS) en CSV bestand blijven open tussen runs
+            while True:
+                started = time.monotonic()
+                try:
+                    await run_once(session, f, cache)
+                except Exception as e:
+                    print(f"\n⚠ Fout tijdens run: {e}")
+                
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def parse_args() -> argparse.Namespace:
+    """Lees de command line opties."""
+    parser = argparse.ArgumentParser(description="Polymarket Data Logger")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="blijf draaien en haal periodiek data op in plaats van één run",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DAEMON_INTERVAL,
+        help=f"seconden tussen runs in daemon mode (standaard {DAEMON_INTERVAL})",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    try:
+        asyncio.run(main(args.daemon, args.interval))
+    except KeyboardInterrupt:
+        pass